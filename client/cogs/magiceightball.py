@@ -1,9 +1,8 @@
 import hashlib
-import json
 import logging
-import re
 from datetime import datetime
-from random import randrange
+from functools import lru_cache
+from random import choice
 
 from disnake import Embed
 from disnake.ext import commands
@@ -11,15 +10,40 @@ from disnake.ext import commands
 from core.client import Client
 from utils.decorators import metadata
 
+try:
+    import orjson as _json_fast
+except ImportError:  # orjson is optional, stdlib json parses the same bytes
+    import json as _json_fast
+
 logger = logging.getLogger(__name__)
 
+# ASCII characters that are stripped from questions (non-ASCII is dropped while encoding)
+_NON_ALNUM_ASCII = bytes(c for c in range(128) if not chr(c).isalnum())
+
+
+@lru_cache(maxsize=1024)
+def _prefix_hasher(day: str, author_id: int):
+    """Hash state seeded with the `<day>.<author_id>.` prefix. Must be copied before use!"""
+    return hashlib.blake2b(f"{day}.{author_id}.".encode(), digest_size=1)
+
+
+def _answer_bucket(day: str, author_id: int, parsed: bytes) -> int:
+    """Index of the answer set (yes / no) for an already parsed question"""
+    hasher = _prefix_hasher(day, author_id).copy()
+    hasher.update(parsed)
+    return hasher.digest()[0] & 1
+
 
 class MagicEightBallCommand(commands.Cog):
     def __init__(self, client: Client):
         self.client = client
 
-        with open("./data/8ball_answers.json") as f:
-            self.answers: list[list[str]] = json.load(f)
+        with open("./data/8ball_answers.json", "rb") as f:
+            self.answers: list[list[str]] = _json_fast.loads(f.read())
+
+        # Formatted date, only rebuilt when the day changes
+        self._cached_ord: int = -1
+        self._cached_day: str = ""
 
     @commands.command(name="8b")
     @commands.cooldown(1, 2, commands.BucketType.user)
@@ -37,17 +61,19 @@ class MagicEightBallCommand(commands.Cog):
         - Day
         """
         # Remove special characters, get author's id and current day
-        parsed = re.sub(r"[^a-zA-Z0-9]", "", args).lower()
-        author_id = ctx.author.id
-        day = datetime.today().strftime("%Y-%m-%d")
-
-        # Calculate hash
-        message_string = f"{day}.{parsed}.{author_id}"
-        hashed_message = int(hashlib.sha1(message_string.encode("utf-8")).hexdigest(), 16)
+        parsed = args.encode("ascii", "ignore").translate(None, _NON_ALNUM_ASCII).lower()
+        author = ctx.author
+        author_id = author.id
+        today = datetime.today()
+        today_ord = today.toordinal()
+        if today_ord != self._cached_ord:
+            self._cached_day = today.strftime("%Y-%m-%d")
+            self._cached_ord = today_ord
+        day = self._cached_day
 
         # Select answer set (yes / no) based on hash
-        answer_set = self.answers[hashed_message % 2]
-        answer = f"🎱 {answer_set[randrange(len(answer_set))]}"
+        answer_set = self.answers[_answer_bucket(day, author_id, parsed)]
+        answer = f"🎱 {choice(answer_set)}"
 
         # Build answer embed
         title = (
@@ -55,7 +81,7 @@ class MagicEightBallCommand(commands.Cog):
         )  # Shortens question if question is too long for an embed
         embed = Embed(
             title=title, description=answer, color=self.client.config.color_default
-        ).set_author(name=f"{ctx.author.display_name} asked", icon_url=ctx.author.avatar.url)
+        ).set_author(name=f"{author.display_name} asked", icon_url=author.avatar.url)
         await ctx.send(embed=embed)
 
 
@@ -1,13 +1,17 @@
+import asyncio
 import logging
-from pathlib import Path
+import os
 
 from disnake.ext import commands
 
-from core.comm import get_wsclient
+from core.comm import WsClient, get_wsclient
 from core.config import Config
+from utils.help import KohakuHelpCommand
 
 logger = logging.getLogger(__name__)
 
+COGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "cogs")
+
 
 class Client(commands.Bot):
     """Custom Kohaku client class"""
@@ -15,15 +19,34 @@ class Client(commands.Bot):
     def __init__(self, config: Config, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.config = config
-        self.websocket = None
+        self.websocket: WsClient | None = None
+        self._ws_task: asyncio.Task | None = None
+        self._features_loaded: bool = False
+        self.ws_ready: bool = False
+        # Bot owner ids, checked by the owner-only decorators and the help command
+        self.owner_id_set: frozenset[int] = frozenset((config.owner_id,))
+
+    async def load_owners(self):
+        """Adds the owner(s) of the Discord application, as resolved by disnake, to the set"""
+        try:
+            # Resolves owner_id / owner_ids, unless disnake already did so on login
+            await self.is_owner(self.user)
+        except Exception as e:
+            logger.error(f"Failed to fetch application owners: {e}")
+            return
+
+        owners = self.owner_ids or ((self.owner_id,) if self.owner_id else ())
+        self.owner_id_set = self.owner_id_set.union(owners)
 
     async def load_features(self):
-        """Loads features like the commands and the websocket"""
+        """Loads one-time features like the commands and the bot owners"""
         # Cogs ( = Commands)
         logger.info("Loading cogs...")
 
-        cogs_dir = Path(__file__).parent.parent / "cogs"
-        cog_files = [f.stem for f in cogs_dir.glob("*.py") if f.stem != "__init__"]
+        with os.scandir(COGS_DIR) as entries:
+            cog_files = [
+                e.name[:-3] for e in entries if e.name.endswith(".py") and e.name != "__init__.py"
+            ]
 
         for cog_name in cog_files:
             try:
@@ -33,18 +56,42 @@ class Client(commands.Bot):
 
         logger.info(f"Loaded {len(self.extensions)} cogs")
 
-        # Websocket ( = Communication to backend)
-        wsclient = get_wsclient()
-        await wsclient.run()
+        # Reset and warm up the help information for the loaded commands
+        KohakuHelpCommand.clear_help_cache()
+        if isinstance(self.help_command, KohakuHelpCommand):
+            self.help_command.prepare_commands(self)
+
+        await self.load_owners()
+
+    def start_websocket(self):
+        """Starts the websocket ( = Communication to backend), unless it is still running"""
+        if self._ws_task is not None and not self._ws_task.done():
+            return
+        self.websocket = get_wsclient()
+        self.websocket.on_connection_change = self.set_ws_ready
+        # Runs in the background; the reference keeps the task from being garbage collected
+        self._ws_task = asyncio.create_task(self.websocket.run())
+
+    def set_ws_ready(self, ready: bool):
+        """Track the websocket connection state (checked by `requires_websocket`)"""
+        self.ws_ready = ready
 
     async def on_ready(self):
-        await self.load_features()
+        # on_ready fires again after reconnects, features only need to be loaded once
+        if not self._features_loaded:
+            self._features_loaded = True
+            await self.load_features()
+
+        # Restarts the websocket if the backend connection dropped in the meantime
+        self.start_websocket()
 
         logger.info(f"Kohaku is ready! Logged in as {self.user}")
         logger.info(f"Connected to {len(self.guilds)} guilds")
 
     async def close(self):
         logger.info("Shutting down bot...")
+        if self._ws_task is not None:
+            self._ws_task.cancel()
         if self.websocket is not None:
             await self.websocket.stop()
         await super().close()
@@ -1,5 +1,5 @@
-import asyncio
 import logging
+from collections.abc import Callable
 from pathlib import Path
 
 import websockets
@@ -16,24 +16,25 @@ class WsClient:
         self.api_key: str | None = self.load_api_key()
         self.websocket: ClientConnection | None = None
         self.running: bool = False
-        self.heartbeat_timeout: int = 90
+        # Called with the new state whenever the connection is established or lost
+        self.on_connection_change: Callable[[bool], None] | None = None
 
     def load_api_key(self) -> str | None:
         """Load API key from .secret file"""
         secret_path = Path(".secret")
         if not secret_path.exists():
-            logger.error(f"Secret file '{secret_path}' not found")
+            logger.error("Secret file '%s' not found", secret_path)
             return None
 
         try:
             api_key = secret_path.read_text().strip()
             if not api_key:
-                logger.error(f"Secret file '{secret_path}' is empty")
+                logger.error("Secret file '%s' is empty", secret_path)
                 return None
             logger.info("API key loaded successfully")
             return api_key
         except Exception as e:
-            logger.error(f"Failed to read secret file: {e}")
+            logger.error("Failed to read secret file: %s", e)
             return None
 
     async def connect(self) -> bool:
@@ -41,12 +42,20 @@ class WsClient:
         if self.api_key is not None:
             headers = {"X-API-Key": self.api_key}
             try:
-                self.websocket = await connect(self.url, additional_headers=headers)
+                # Keepalive (ping / pong) is handled by the websockets library
+                self.websocket = await connect(
+                    self.url,
+                    additional_headers=headers,
+                    ping_interval=30,
+                    ping_timeout=60,
+                    max_queue=32,
+                )
                 self.running = True
-                logger.info(f"Connected to {self.url}")
+                self.notify_connection_change(True)
+                logger.info("Connected to %s", self.url)
                 return True
             except Exception as e:
-                logger.error(f"Failed to connect: {e}")
+                logger.error("Failed to connect: %s", e)
                 return False
         return False
 
@@ -62,44 +71,36 @@ class WsClient:
             logger.info("Connection closed by server")
             self.running = False
         except Exception as e:
-            logger.error(f"Error in receive task: {e}")
-
-    async def heartbeat_task(self):
-        """Monitor server activity and close if no response"""
-        last_activity = asyncio.get_event_loop().time()
-
-        while self.running and self.websocket:
-            await asyncio.sleep(30)
-            current_time = asyncio.get_event_loop().time()
-
-            if current_time - last_activity > self.heartbeat_timeout:
-                logger.warning("No server activity detected, closing connection")
-                self.running = False
-                if self.websocket:
-                    await self.websocket.close()
-                break
-
-            if self.websocket and not self.websocket.closed:
-                last_activity = current_time
+            logger.error("Error in receive task: %s", e)
 
     async def run(self):
-        """Run all tasks concurrently"""
+        """Run the client until the connection closes"""
         if not await self.connect():
             return
 
         try:
-            # Run receive and heartbeat tasks concurrently
-            # Ping/Pong get automatically handled by the websockets library
-            await asyncio.gather(self.receive_task(), self.heartbeat_task(), return_exceptions=True)
+            await self.receive_task()
         finally:
+            self.notify_connection_change(False)
             if self.websocket:
                 await self.websocket.close()
             logger.info("WebSocket client shut down")
 
+    def notify_connection_change(self, connected: bool):
+        """Pass the connection state to the registered listener, if any"""
+        if self.on_connection_change is not None:
+            self.on_connection_change(connected)
+
+    async def stop(self):
+        """Stop all tasks and close the connection"""
+        self.running = False
+        if self.websocket:
+            await self.websocket.close()
+
     async def handle_server_message(self, message: str):
         """Process incoming server events"""
         # TODO: Implement
-        logger.info(f"Process message: {message}")
+        logger.info("Process message: %s", message)
 
 
 wsclient: WsClient | None = None
@@ -48,15 +48,17 @@ class Config:
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from environment variables"""
+        # Single snapshot of the environment, plain dict lookups from here on
+        env = os.environ.copy()
         try:
             config = cls(
-                token=os.getenv("CLIENT_TOKEN", ""),
-                prefix=os.getenv("CLIENT_PREFIX", ""),
-                server_ws_url=os.getenv("SERVER_WS_URL", ""),
-                server_api_url=os.getenv("SERVER_API_URL", ""),
-                logging_level=os.getenv("CLIENT_LOGGING_LEVEL", "INFO"),
-                repo=os.getenv("CLIENT_REPO_URL"),
-                owner_id=int(os.getenv("OWNER_ID")),
+                token=env.get("CLIENT_TOKEN", ""),
+                prefix=env.get("CLIENT_PREFIX", ""),
+                server_ws_url=env.get("SERVER_WS_URL", ""),
+                server_api_url=env.get("SERVER_API_URL", ""),
+                logging_level=env.get("CLIENT_LOGGING_LEVEL", "INFO"),
+                repo=env.get("CLIENT_REPO_URL"),
+                owner_id=int(env.get("OWNER_ID")),
             )
             logger.info("Configuration loaded successfully")
             return config
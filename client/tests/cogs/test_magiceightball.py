@@ -184,3 +184,29 @@ async def test_special_characters(cog, mock_context):
             assert answer2 in cog.answers[0]
         else:
             assert answer2 in cog.answers[1]
+
+
+@pytest.mark.asyncio
+async def test_day_cache(cog, mock_context):
+    """Test that the formatted day is only rebuilt when the day changes"""
+    question = "Is Kohaku a brat?"
+
+    with patch("cogs.magiceightball.datetime") as mock_datetime:
+        today = mock_datetime.today.return_value
+        today.toordinal.return_value = 739617
+        today.strftime.return_value = "2026-01-01"
+
+        await cog.magic_eight_ball.callback(cog, mock_context, args=question)
+        await cog.magic_eight_ball.callback(cog, mock_context, args=question)
+
+        # Same day: Formatted only once
+        assert today.strftime.call_count == 1
+        assert cog._cached_day == "2026-01-01"
+
+        # Next day: Formatted again
+        today.toordinal.return_value = 739618
+        today.strftime.return_value = "2026-01-02"
+        await cog.magic_eight_ball.callback(cog, mock_context, args=question)
+
+        assert today.strftime.call_count == 2
+        assert cog._cached_day == "2026-01-02"
@@ -0,0 +1,133 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from utils.decorators import (
+    EMBED_NO_WEBSOCKET,
+    EMBED_NOT_BOT_OWNER,
+    EMBED_NOT_SERVER_OR_BOT_OWNER,
+    metadata,
+    owner_check,
+    requires_websocket,
+    shorten_description,
+)
+
+# ===================== Mocking ===================== #
+# Setup mocking parameters like the context and a guarded command
+
+
+@pytest.fixture
+def mock_context():
+    """Mocks the commands context of a user that is neither bot nor server owner"""
+    ctx = MagicMock()
+    ctx.author.id = 12345678
+    ctx.bot.owner_id_set = frozenset({1})
+    ctx.bot.ws_ready = True
+    ctx.guild.owner_id = 2
+    ctx.send = AsyncMock()
+    return ctx
+
+
+def guarded(decorator):
+    """Returns a cog-like object whose `run` command is guarded by the decorator"""
+
+    class Cog:
+        def __init__(self):
+            self.calls = 0
+
+        @decorator
+        async def run(self, ctx):
+            self.calls += 1
+
+    return Cog()
+
+
+# ===================== Testing ===================== #
+
+
+def test_short_description_unchanged():
+    """Test that descriptions up to 60 characters are kept as they are"""
+    description = "Ask a yes/no question and receive mystical wisdom!"
+    assert shorten_description(description) == description
+    assert shorten_description("x" * 60) == "x" * 60
+
+
+def test_long_description_cut_at_word():
+    """Test that long descriptions are cut at the last space between character 50 and 60"""
+    description = "a" * 52 + " " + "b" * 4 + " " + "c" * 100
+    assert shorten_description(description) == "a" * 52 + " " + "b" * 4 + " [...]"
+
+
+def test_long_description_single_word():
+    """Test that long descriptions without a fitting space are cut hard"""
+    assert shorten_description("x" * 100) == "x" * 55 + " [...]"
+
+
+def test_metadata_description_short():
+    """Test that the metadata decorator stores the shortened description"""
+
+    @metadata(title="Test", description="x" * 100)
+    async def command(): ...
+
+    assert command.__metadata__["title"] == "Test"
+    assert command.__metadata__["description"] == "x" * 100
+    assert command.__metadata__["description_short"] == "x" * 55 + " [...]"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_server_owner", [False, True])
+async def test_owner_check_bot_owner(mock_context, include_server_owner):
+    """Test that bot owners are always allowed"""
+    mock_context.author.id = 1
+    cog = guarded(owner_check(include_server_owner=include_server_owner))
+
+    await cog.run(mock_context)
+
+    assert cog.calls == 1
+    mock_context.send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_owner_check_server_owner(mock_context):
+    """Test that server owners are only allowed if included"""
+    mock_context.author.id = 2
+
+    cog = guarded(owner_check(include_server_owner=True))
+    await cog.run(mock_context)
+    assert cog.calls == 1
+    mock_context.send.assert_not_called()
+
+    cog = guarded(owner_check())
+    await cog.run(mock_context)
+    assert cog.calls == 0
+    mock_context.send.assert_called_once_with(embed=EMBED_NOT_BOT_OWNER)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("include_server_owner", "embed"),
+    [(False, EMBED_NOT_BOT_OWNER), (True, EMBED_NOT_SERVER_OR_BOT_OWNER)],
+)
+async def test_owner_check_denied(mock_context, include_server_owner, embed):
+    """Test that other users get the matching error embed and the command is not run"""
+    cog = guarded(owner_check(include_server_owner=include_server_owner))
+
+    await cog.run(mock_context)
+
+    assert cog.calls == 0
+    mock_context.send.assert_called_once_with(embed=embed)
+
+
+@pytest.mark.asyncio
+async def test_requires_websocket(mock_context):
+    """Test that commands only run while the websocket is ready"""
+    cog = guarded(requires_websocket)
+
+    await cog.run(mock_context)
+    assert cog.calls == 1
+    mock_context.send.assert_not_called()
+
+    mock_context.bot.ws_ready = False
+    await cog.run(mock_context)
+    assert cog.calls == 1
+    mock_context.send.assert_called_once_with(embed=EMBED_NO_WEBSOCKET)
@@ -0,0 +1,132 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import disnake
+import pytest
+import pytest_asyncio
+from disnake.ext import commands
+
+from utils.decorators import metadata
+from utils.help import KohakuHelpCommand
+
+# ===================== Mocking ===================== #
+# Setup mocking parameters like bot, context and the help command
+
+
+class HelpTestCog(commands.Cog):
+    @commands.group(name="grp", aliases=["g"])
+    @metadata(title="Group", category="Admin", description="A group")
+    async def grp(self, ctx): ...
+
+    @grp.command(name="sub")
+    @metadata(usage="<thing>")
+    async def sub(self, ctx): ...
+
+    @grp.command(name="long")
+    @metadata(description="A subcommand description that is way too long for the group listing")
+    async def long(self, ctx): ...
+
+    @commands.command(name="plain")
+    async def plain(self, ctx): ...
+
+    @commands.command(name="aliased", aliases=["a"])
+    async def aliased(self, ctx): ...
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolates the class-level help cache between tests"""
+    KohakuHelpCommand.clear_help_cache()
+    yield
+    KohakuHelpCommand.clear_help_cache()
+
+
+@pytest_asyncio.fixture
+async def bot():
+    """Bot with the help command and a test cog"""
+    bot = commands.Bot(
+        command_prefix="-", intents=disnake.Intents.all(), help_command=KohakuHelpCommand()
+    )
+    bot.add_cog(HelpTestCog())
+    return bot
+
+
+@pytest_asyncio.fixture
+async def help_command(bot):
+    """Help command copy as used for one invocation"""
+    help_command = bot.help_command.copy()
+    help_command.context = MagicMock()
+    help_command.context.bot.owner_id_set = frozenset({1})
+    help_command.context.author.id = 12345678
+    help_command.context.guild.id = 42
+    help_command.filter_commands = AsyncMock(side_effect=lambda cmds, **kwargs: cmds)
+    help_command.destination = AsyncMock()
+    help_command.get_destination = MagicMock(return_value=help_command.destination)
+    return help_command
+
+
+# ===================== Testing ===================== #
+
+
+@pytest.mark.asyncio
+async def test_prepare_commands(bot):
+    """Test that per-command help information is cached on the commands"""
+    help_command = bot.help_command
+    help_command.prepare_commands(bot)
+
+    sub = bot.get_command("grp sub")
+    assert sub._help_category == "Admin"  # Inherited from group
+    assert sub._help_group_title == "Group"
+    assert sub._help_signature == f"{help_command.prefix}grp sub <thing>"
+    assert bot.get_command("grp")._help_aliases == "`g`"
+    assert bot.get_command("plain")._help_category == "Other"
+    assert bot.get_command("plain")._help_group_title is None
+
+
+@pytest.mark.asyncio
+async def test_bot_help_cache(bot, help_command):
+    """Test that the -help listing is computed once and reused until the cache is cleared"""
+    mapping = {None: list(bot.commands)}
+
+    await help_command.send_bot_help(mapping)
+    fields1 = help_command.destination.send.call_args.kwargs["embed"].fields
+    assert [f.name for f in fields1] == ["🔧 __Admin__", "ℹ️ __Info__", "📦 __Other__"]
+    assert help_command.filter_commands.call_count == 1
+
+    # Cache hit: Same listing without filtering again
+    await help_command.send_bot_help(mapping)
+    fields2 = help_command.destination.send.call_args.kwargs["embed"].fields
+    assert [(f.name, f.value) for f in fields2] == [(f.name, f.value) for f in fields1]
+    assert help_command.filter_commands.call_count == 1
+
+    # Different guild: Separate cache entry
+    help_command.context.guild.id = 43
+    await help_command.send_bot_help(mapping)
+    assert help_command.filter_commands.call_count == 2
+
+    # Cleared: Computed again
+    KohakuHelpCommand.clear_help_cache()
+    await help_command.send_bot_help(mapping)
+    assert help_command.filter_commands.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_command_help_aliases_without_description(bot, help_command):
+    """Test that commands with aliases but without description render their aliases"""
+    await help_command.send_command_help(bot.get_command("aliased"))
+
+    embed = help_command.destination.send.call_args.kwargs["embed"]
+    assert embed.description == "🔄 Aliases: `a`"
+
+
+@pytest.mark.asyncio
+async def test_group_help_long_subcommand_description(bot, help_command):
+    """Test that long subcommand descriptions are shortened in the group help"""
+    await help_command.send_group_help(bot.get_command("grp"))
+
+    embed = help_command.destination.send.call_args.kwargs["embed"]
+    assert embed.description == "A group\n🔄 Aliases: `g`"
+    subcommands = embed.fields[1].value.split("\n")
+    assert (
+        "`long` - A subcommand description that is way too long for the group [...]" in subcommands
+    )
+    assert "`sub`" in subcommands
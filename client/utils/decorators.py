@@ -4,7 +4,32 @@ from disnake import Embed
 
 from core.config import get_config
 
-CONFIG = get_config()
+COLOR_ERROR = get_config().color_error
+
+# Static error embeds, built once and reused for every rejected command
+EMBED_NO_WEBSOCKET = Embed(
+    description="❌ Backend connection unavailable. Please try again later!",
+    color=COLOR_ERROR,
+)
+EMBED_NOT_BOT_OWNER = Embed(
+    description="❌ You must be the bot owner to use this command!",
+    color=COLOR_ERROR,
+)
+EMBED_NOT_SERVER_OR_BOT_OWNER = Embed(
+    description="❌ You must be the server or bot owner to use this command!",
+    color=COLOR_ERROR,
+)
+
+
+def shorten_description(description: str) -> str:
+    """Shortens descriptions longer than 60 characters, preferably at a word boundary"""
+    if len(description) <= 60:
+        return description
+    i = description.rfind(" ", 50, 60)
+    if i == -1:
+        # One long word
+        i = 55
+    return description[:i] + " [...]"
 
 
 def metadata(**meta_kwargs):
@@ -13,9 +38,11 @@ def metadata(**meta_kwargs):
     """
 
     def decorator(func):
-        if not hasattr(func, "__metadata__"):
-            func.__metadata__ = {}
-        func.__metadata__.update(meta_kwargs)
+        meta = func.__dict__.setdefault("__metadata__", {})
+        meta.update(meta_kwargs)
+        if "description" in meta_kwargs:
+            # Used for listings, e.g. subcommands in the group help
+            meta["description_short"] = shorten_description(meta_kwargs["description"])
         return func
 
     return decorator
@@ -28,51 +55,35 @@ def requires_websocket(func):
 
     @wraps(func)
     async def wrapper(self, ctx, *args, **kwargs):
-        if not ctx.bot.websocket or not ctx.bot.websocket.connected:
-            embed = Embed(
-                description="❌ Backend connection unavailable. Please try again later!",
-                color=CONFIG.color_error,
-            )
-            await ctx.send(embed=embed)
+        if not ctx.bot.ws_ready:
+            await ctx.send(embed=EMBED_NO_WEBSOCKET)
             return None
         return await func(self, ctx, *args, **kwargs)
 
     return wrapper
 
 
-def bot_owner_only(func):
+def owner_check(include_server_owner: bool = False):
     """
-    Decorator to restrict command to bot owner only
+    Decorator to restrict command to bot owner (and server owner, if included) only
     """
+    denied_embed = EMBED_NOT_SERVER_OR_BOT_OWNER if include_server_owner else EMBED_NOT_BOT_OWNER
 
-    @wraps(func)
-    async def wrapper(self, ctx, *args, **kwargs):
-        if await ctx.bot.is_owner(ctx.author):
-            return await func(self, ctx, *args, **kwargs)
-        embed = Embed(
-            description="❌ You must be the bot owner to use this command!",
-            color=CONFIG.color_error,
-        )
-        return await ctx.send(embed=embed)
-
-    return wrapper
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, ctx, *args, **kwargs):
+            if ctx.author.id in ctx.bot.owner_id_set or (
+                include_server_owner and ctx.guild and ctx.guild.owner_id == ctx.author.id
+            ):
+                return await func(self, ctx, *args, **kwargs)
+            return await ctx.send(embed=denied_embed)
 
+        return wrapper
 
-def server_or_bot_owner_only(func):
-    """
-    Decorator to restrict command to server and bot owner only
-    """
+    return decorator
 
-    @wraps(func)
-    async def wrapper(self, ctx, *args, **kwargs):
-        if await ctx.bot.is_owner(ctx.author) or (
-            ctx.guild and ctx.guild.owner_id == ctx.author.id
-        ):
-            return await func(self, ctx, *args, **kwargs)
-        embed = Embed(
-            description="❌ You must be the server or bot owner to use this command!",
-            color=CONFIG.color_error,
-        )
-        return await ctx.send(embed=embed)
 
-    return wrapper
+# Restrict command to bot owner only
+bot_owner_only = owner_check()
+# Restrict command to server and bot owner only
+server_or_bot_owner_only = owner_check(include_server_owner=True)
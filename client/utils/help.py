@@ -1,9 +1,58 @@
+from collections import defaultdict
+
 from disnake import ButtonStyle, Embed
 from disnake.ext import commands
 from disnake.ui import Button, View
 
 from core.config import get_config
 
+# Shared fallback for commands without metadata (never mutated)
+_EMPTY = {}
+# Marks per-command help information that was not computed yet
+_MISSING = object()
+
+CATEGORY_EMOJIS = {
+    "Admin": "🔧",
+    "Games": "🎮",
+    "Utils": "🔨",
+    "Fun": "🎉",
+    "Info": "ℹ️",
+    "Other": "📦",
+}
+DEFAULT_EMOJI = CATEGORY_EMOJIS["Other"]
+
+# Static part of the `-help` embed
+BOT_HELP_TEMPLATE = {
+    "title": "KOᕼᗩKᑌ",
+    "description": "Wasshoi~!\nType `-help <command>` to see more details about a particular command.",
+    "color": get_config().color_default,
+    "footer": {"text": "v3.0a | <..> Mandatory | (...) optional"},
+}
+
+
+def _category_sort_key(category):
+    """Sorts categories by name, with 'Other' last"""
+    return (category == "Other", category)
+
+
+def _cached(command, attr, compute):
+    """
+    Get per-command help information stored on the command, computing it on first use.
+    Commands don't change once loaded (reloading a cog creates new command objects).
+    """
+    value = getattr(command, attr, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        setattr(command, attr, value)
+    return value
+
+
+def _command_sort_key(command):
+    """Sorts commands before groups, then by name"""
+    return _cached(
+        command, "_help_sort_key", lambda: (isinstance(command, commands.Group), command.name)
+    )
+
 
 class KohakuHelpCommand(commands.HelpCommand):
     """
@@ -14,6 +63,13 @@ class KohakuHelpCommand(commands.HelpCommand):
     - `-help <command/group>` - Shows help for a specific command/group
     """
 
+    # Shared across instances, as disnake copies the help command for every invocation
+    # Rendered `-help` fields per (is bot owner, guild id)
+    _bot_help_cache: dict[tuple[bool, int], list[tuple[str, str]]] = {}
+    # Github link button, shared by all help messages for the lifetime of the process
+    # (no timeout, as link buttons need no interaction state)
+    _repo_view: View | None = None
+
     def __init__(self):
         config = get_config()
         self.prefix = config.prefix
@@ -21,35 +77,49 @@ class KohakuHelpCommand(commands.HelpCommand):
         self.color = config.color_default
         self.color_error = config.color_error
 
-        self.CATEGORY_EMOJIS = {
-            "Admin": "🔧",
-            "Games": "🎮",
-            "Utils": "🔨",
-            "Fun": "🎉",
-            "Info": "ℹ️",
-            "Other": "📦",
-        }
-
         super().__init__(
             command_attrs={
                 "aliases": ["h"],
             }
         )
 
+    @classmethod
+    def clear_help_cache(cls):
+        """
+        Clears the cached `-help` listings. Needs to be called after (un)loading cogs.
+
+        Listings are cached per (is bot owner, guild id) only, so every member of a guild gets
+        the listing of the first caller. Per-member or per-channel checks (e.g. permissions) are
+        therefore not reflected, and the cache grows by one entry per guild until cleared.
+        """
+        cls._bot_help_cache.clear()
+
+    def prepare_commands(self, bot):
+        """Precomputes the per-command help information of all commands (after loading cogs)"""
+        for command in bot.walk_commands():
+            self.get_command_category(command)
+            self.get_command_signature(command)
+            self.get_group_title(command)
+            self.get_command_aliases(command)
+            _command_sort_key(command)
+
     def get_decorator_var(self, command, key, default=None):
-        try:
-            return command.callback.__metadata__[key]
-        except Exception:
-            return default
+        return self.get_metadata(command).get(key, default)
+
+    def get_metadata(self, command):
+        """Get the metadata attached by the `metadata` decorator. Empty if not present"""
+        return getattr(command.callback, "__metadata__", _EMPTY)
 
     def get_command_category(self, command):
         """Get the category of a command. If not present, default to category 'Other'"""
-        if command.parent is None:
-            return self.get_decorator_var(command, "category", default="Other")
-        category = self.get_decorator_var(command, "category")
-        if category is None:
-            return self.get_command_category(command.parent)
-        return category
+
+        def compute():
+            category = self.get_decorator_var(command, "category")
+            if category is not None:
+                return category
+            return "Other" if command.parent is None else self.get_command_category(command.parent)
+
+        return _cached(command, "_help_category", compute)
 
     def get_group_title(self, command):
         """
@@ -57,75 +127,88 @@ class KohakuHelpCommand(commands.HelpCommand):
         If command is not part of a group, return None.
         Otherwise, take title from top-level group.
         """
-        if command.parent is None:
-            # Top-Level
-            if isinstance(command, commands.Group):
-                # Is Group: Get title
-                return self.get_decorator_var(command, "title", default=command.name)
-            # Is not a group!
-            return None
-        return self.get_group_title(command.parent)
+
+        def compute():
+            if command.parent is None:
+                # Top-Level
+                if isinstance(command, commands.Group):
+                    # Is Group: Get title
+                    return self.get_decorator_var(command, "title", default=command.name)
+                # Is not a group!
+                return None
+            return self.get_group_title(command.parent)
+
+        return _cached(command, "_help_group_title", compute)
+
+    def get_command_aliases(self, command):
+        """Get the rendered aliases of a command. Empty if the command has none"""
+        return _cached(
+            command, "_help_aliases", lambda: ", ".join(f"`{a}`" for a in command.aliases)
+        )
 
     def get_category_emoji(self, category_name):
         """Get emoji for a category. If not present, default to emoji of 'Other'"""
-        if category_name in self.CATEGORY_EMOJIS:
-            return self.CATEGORY_EMOJIS[category_name]
-        return self.CATEGORY_EMOJIS["Other"]
+        return CATEGORY_EMOJIS.get(category_name, DEFAULT_EMOJI)
 
     def get_command_signature(self, command):
         """Returns the command signautre (prefix + command + usage)"""
-        parent = command.full_parent_name
-        alias = command.name if not parent else f"{parent} {command.name}"
 
-        usage = self.get_decorator_var(command, "usage", default="<args>")
+        def compute():
+            usage = self.get_decorator_var(command, "usage", default="<args>")
+            return f"{self.prefix}{command.qualified_name} {usage}".strip()
 
-        return f"{self.prefix}{alias} {usage}".strip()
+        return _cached(command, "_help_signature", compute)
 
     async def send_bot_help(self, mapping):
         """Sends help for all commands organized by category"""
-        embed = Embed(
-            title="KOᕼᗩKᑌ",
-            description="Wasshoi~!\nType `-help <command>` to see more details about a particular command.",
-            color=self.color,
-        )
+        embed = Embed.from_dict(dict(BOT_HELP_TEMPLATE))
         embed.set_thumbnail(url=self.context.bot.user.display_avatar.url)
-        embed.set_footer(text="v3.0a | <..> Mandatory | (...) optional")
 
         # Add commands based on category
-        all_commands = []
-        for _, cmds in mapping.items():
-            filtered = await self.filter_commands(cmds, sort=True)
-            all_commands.extend(filtered)
+        ctx = self.context
+        cache_key = (ctx.author.id in ctx.bot.owner_id_set, ctx.guild.id if ctx.guild else 0)
+        fields = self._bot_help_cache.get(cache_key)
+        if fields is None:
+            fields = await self.get_bot_help_fields(mapping)
+            self._bot_help_cache[cache_key] = fields
+
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=False)
 
-        categories = {}
+        return await self.get_destination().send(embed=embed, view=self.get_repo_view())
+
+    def get_repo_view(self):
+        """Get the view linking the source repository. None if no repository is configured"""
+        if self.repo is None:
+            return None
+        # Created on first use, as views require a running event loop
+        if KohakuHelpCommand._repo_view is None:
+            view = View(timeout=None)
+            view.add_item(Button(label="Github", style=ButtonStyle.link, url=self.repo, emoji="🔗"))
+            KohakuHelpCommand._repo_view = view
+        return KohakuHelpCommand._repo_view
+
+    async def get_bot_help_fields(self, mapping):
+        """Returns the (name, value) embed fields listing all visible commands by category"""
+        fields = []
+        # One filter pass over all cogs, ordering happens per category below
+        all_commands = await self.filter_commands([c for cmds in mapping.values() for c in cmds])
+
+        categories = defaultdict(list)
         for cmd in all_commands:
             cat = self.get_command_category(cmd) if cmd.name != "help" else "Info"
-            if cat not in categories:
-                categories[cat] = []
             categories[cat].append(cmd)
 
-        sorted_categories = sorted(categories.keys(), key=lambda x: (x == "Other", x))
-        for cat in sorted_categories:
-            cmds = categories[cat]
+        prefix = self.prefix
+        for cat in sorted(categories, key=_category_sort_key):
             emoji = self.get_category_emoji(cat)
 
-            sorted_cmds = sorted(cmds, key=lambda c: (isinstance(c, commands.Group), c.name))
-
-            cmd_list = []
-            for cmd in sorted_cmds:
-                cmd_listing = f"`{self.prefix}{cmd.name}`"
-                cmd_list.append(cmd_listing)
-
-            if cmd_list != []:
-                embed.add_field(name=f"{emoji} __{cat}__", value="\n".join(cmd_list), inline=False)
-
-        # Add source
-        view = None
-        if self.repo is not None:
-            view = View()
-            view.add_item(Button(label="Github", style=ButtonStyle.link, url=self.repo, emoji="🔗"))
+            sorted_cmds = sorted(categories[cat], key=_command_sort_key)
+            if sorted_cmds:
+                value = "\n".join(f"`{prefix}{cmd.name}`" for cmd in sorted_cmds)
+                fields.append((f"{emoji} __{cat}__", value))
 
-        return await self.get_destination().send(embed=embed, view=view)
+        return fields
 
     async def send_command_help(self, command):
         """Sends help for one specfic command"""
@@ -135,11 +218,12 @@ class KohakuHelpCommand(commands.HelpCommand):
         cat_name = self.get_command_category(command)
         emoji = self.get_category_emoji(cat_name)
 
-        name = self.get_decorator_var(command, "title", default=command.name)
-        desc = self.get_decorator_var(command, "description")
-        if command.aliases:
-            aliases = ", ".join([f"`{alias}`" for alias in command.aliases]).strip()
-            desc += f"\n🔄 Aliases: {aliases}"
+        meta = self.get_metadata(command)
+        name = meta.get("title", command.name)
+        desc = meta.get("description")
+        aliases = self.get_command_aliases(command)
+        if aliases:
+            desc = f"{desc}\n🔄 Aliases: {aliases}" if desc else f"🔄 Aliases: {aliases}"
 
         usage = self.get_command_signature(command)
 
@@ -161,25 +245,19 @@ class KohakuHelpCommand(commands.HelpCommand):
         cat_name = self.get_command_category(group)
         emoji = self.get_category_emoji(cat_name)
 
-        name = self.get_decorator_var(group, "title", default=group.name)
-        desc = self.get_decorator_var(group, "description")
-        if group.aliases:
-            aliases = ", ".join([f"`{alias}`" for alias in group.aliases]).strip()
-            desc += f"\n🔄 Aliases: {aliases}"
+        meta = self.get_metadata(group)
+        name = meta.get("title", group.name)
+        desc = meta.get("description")
+        aliases = self.get_command_aliases(group)
+        if aliases:
+            desc = f"{desc}\n🔄 Aliases: {aliases}" if desc else f"🔄 Aliases: {aliases}"
 
         usage = self.get_command_signature(group)
 
         subcommands = []
         for cmd in group.commands:
-            cmd_desc = self.get_decorator_var(cmd, "description")
+            cmd_desc = self.get_metadata(cmd).get("description_short")
             if cmd_desc is not None:
-                if len(cmd_desc) > 60:
-                    # Shorten description
-                    i = cmd_desc.rfind(" ", start=50)
-                    if i == -1:
-                        # One long word
-                        i = 55
-                    cmd_desc = cmd_desc[:i] + " [...]"
                 subcommands.append(f"`{cmd.name}` - {cmd_desc}")
             else:
                 subcommands.append(f"`{cmd.name}`")